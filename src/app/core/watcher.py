@@ -11,6 +11,7 @@ from typing import Callable, Optional
 import tomli
 from watchdog.observers import Observer
 from watchdog.events import PatternMatchingEventHandler, FileSystemEvent
+from ..utils.settings import load_settings
 
 
 class DebouncedPatternMatchingEventHandler(PatternMatchingEventHandler):
@@ -121,8 +122,7 @@ class Watcher:
         """
         config_path = Path("config/settings.toml")
         try:
-            with open(config_path, "rb") as f:
-                return tomli.load(f)
+            return load_settings(config_path)
         except (FileNotFoundError, tomli.TOMLDecodeError):
             return {}
 
@@ -675,14 +675,18 @@ class ConfigTab(QWidget):
                 webhook_url=webhook_url,
                 channel=self.slack_channel_input.text().strip() or "#general",
                 username=self.slack_username_input.text().strip() or "Sheets-Bot",
-                icon_emoji=self.slack_icon_input.text().strip() or ":robot_face:"
+                icon_emoji=self.slack_icon_input.text().strip() or ":robot_face:",
+                # Runs on the GUI thread: single attempt, never throttled
+                max_retries=0,
+                throttle=False,
             )
             
             # Send test message
             test_diff = {"added": 3, "updated": 2, "deleted": 1}
             test_url = "https://docs.google.com/spreadsheets/d/test"
             
-            success = test_notifier.post_summary(test_diff, test_url)
+            with test_notifier:
+                success = test_notifier.post_summary(test_diff, test_url)
             
             if success:
                 self.test_result_label.setText("✅ Slack notification sent successfully! Check your Slack channel.")
@@ -78,8 +78,8 @@ class ManualSyncWorker(QThread):
 
             # Step 4: Send Slack notification
             try:
-                notifier = SlackNotifier.from_settings()
-                slack_success = notifier.post_summary(diff_result, sheet_url)
+                with SlackNotifier.from_settings() as notifier:
+                    slack_success = notifier.post_summary(diff_result, sheet_url)
                 if slack_success:
                     self.logger.info("Slack notification sent successfully")
                 else:
@@ -136,8 +136,8 @@ class WatcherWorker(QThread):
             # Step 4: Send Slack notification
             slack_success = False
             try:
-                notifier = SlackNotifier.from_settings()
-                slack_success = notifier.post_summary(diff_result, sheet_url)
+                with SlackNotifier.from_settings() as notifier:
+                    slack_success = notifier.post_summary(diff_result, sheet_url)
                 if slack_success:
                     self.logger.info("Slack notification sent successfully")
                 else:
@@ -4,11 +4,29 @@ This module provides functionality to send formatted diff summaries to Slack
 channels using Incoming Webhooks with rich message formatting.
 """
 
+import json
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 import requests
-import tomli
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from ..utils.settings import load_settings
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry that limits how long a Retry-After header may stall a post."""
+
+    RETRY_AFTER_CAP = 30.0
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_CAP)
 
 
 class SlackNotifier:
@@ -18,12 +36,35 @@ class SlackNotifier:
     rich formatting including added/updated/deleted counts and sheet URLs.
     """
 
+    # Retry policy for rate-limited (429) and server-error (5xx) responses
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 1.0
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Per-request connect/read timeout in seconds, so a stalled webhook
+    # cannot block callers or close() indefinitely
+    TIMEOUT = 5.0
+
+    # Slack accepts about one message per second per webhook; shared across
+    # instances since the GUI creates a fresh notifier for every file
+    MIN_POST_INTERVAL = 1.0
+    _rate_lock = threading.Lock()
+    _last_post: Dict[str, float] = {}
+
+    # Attachment body: diff counts as "+added / updated / deleted" and sheet link
+    _ATTACHMENT_FMT = (
+        "📊 *Changes*: +{added} / {updated} / {deleted}\n"
+        "🔗 *Sheet*: <{url}|View Updated Sheet>"
+    )
+
     def __init__(
         self,
         webhook_url: str,
         channel: str,
         username: str = "Sheets-Bot",
         icon_emoji: str = ":robot_face:",
+        max_retries: int = MAX_RETRIES,
+        throttle: bool = True,
     ):
         """Initialize SlackNotifier with webhook configuration.
 
@@ -32,15 +73,51 @@ class SlackNotifier:
             channel: Target Slack channel (e.g., "#general")
             username: Bot username for messages (default: "Sheets-Bot")
             icon_emoji: Bot icon emoji (default: ":robot_face:")
+            max_retries: Retries for 429/5xx responses (default: MAX_RETRIES);
+                pass 0 for interactive checks that must not block
+            throttle: Space posts to this webhook MIN_POST_INTERVAL apart
+                (default: True); disable for interactive checks
         """
         self.webhook_url = webhook_url
         self.channel = channel
         self.username = username
         self.icon_emoji = icon_emoji
+        self._throttle_enabled = throttle
+
+        # Invariant part of every message payload, built once
+        self._payload_template = {
+            "text": "✅ Sheets Bot Sync Completed",
+            "channel": channel,
+            "username": username,
+            "icon_emoji": icon_emoji,
+        }
+
+        # Persistent session keeps the webhook connection alive between posts
+        self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
+        # read=0: never resend a POST whose body may already have been accepted
+        retry = _CappedRetry(
+            total=max_retries,
+            read=0,
+            backoff_factor=self.BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(max_retries=retry))
+
+        # Single worker keeps queued notifications in submission order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slack")
 
     def post_summary(self, diff: Dict[str, int], sheet_url: str) -> bool:
         """Post diff summary to Slack channel.
 
+        Rate-limited (429) and server-error (5xx) responses are retried up to
+        max_retries times with exponential backoff, honoring Retry-After capped
+        at 30 seconds. In the worst case a call blocks for about two minutes
+        (three capped waits plus TIMEOUT per attempt).
+
         Args:
             diff: Dictionary with added/updated/deleted counts
             sheet_url: URL to the Google Sheets document
@@ -49,24 +126,73 @@ class SlackNotifier:
             bool: True if message sent successfully (HTTP 200), False otherwise
         """
         try:
-            # Build message payload
+            # Build message payload and serialize it once for all attempts
             payload = self._build_payload(diff, sheet_url)
+            body = json.dumps(
+                payload, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
 
-            # Send POST request to webhook URL
-            response = requests.post(self.webhook_url, json=payload)
+            # Stay under Slack's rate limit instead of paying for 429 retries
+            if self._throttle_enabled:
+                self._throttle()
+
+            # Send POST request to webhook URL; retries happen in the adapter
+            response = self._session.post(
+                self.webhook_url, data=body, timeout=self.TIMEOUT
+            )
 
             if response.status_code == 200:
                 return True
-            else:
-                logging.warning(
-                    f"Slack notification failed with status {response.status_code}: {response.text}"
-                )
-                return False
+
+            logging.warning(
+                f"Slack notification failed with status {response.status_code}: {response.text}"
+            )
+            return False
 
         except Exception as e:
             logging.warning(f"Slack notification failed with exception: {str(e)}")
             return False
 
+    def post_summary_async(self, diff: Dict[str, int], sheet_url: str) -> Future:
+        """Queue a diff summary for delivery on a background thread.
+
+        Returns immediately so the caller does not wait on the Slack round trip.
+
+        Args:
+            diff: Dictionary with added/updated/deleted counts
+            sheet_url: URL to the Google Sheets document
+
+        Returns:
+            Future: Resolves to the same bool that post_summary would return
+        """
+        return self._executor.submit(self.post_summary, diff, sheet_url)
+
+    def close(self) -> None:
+        """Deliver queued notifications and release the HTTP connection."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self) -> "SlackNotifier":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _throttle(self) -> None:
+        """Block until MIN_POST_INTERVAL has passed since this webhook's last post."""
+        # Reserve this post's slot under the lock, but sleep outside it so
+        # waits on one webhook never hold up posts to another
+        with SlackNotifier._rate_lock:
+            now = time.monotonic()
+            last_post = SlackNotifier._last_post.get(self.webhook_url)
+            wait = 0.0
+            if last_post is not None:
+                wait = max(0.0, self.MIN_POST_INTERVAL - (now - last_post))
+            SlackNotifier._last_post[self.webhook_url] = now + wait
+
+        if wait > 0:
+            time.sleep(wait)
+
     def _build_payload(self, diff: Dict[str, int], sheet_url: str) -> Dict[str, Any]:
         """Build Slack message payload with formatted diff summary.
 
@@ -77,20 +203,16 @@ class SlackNotifier:
         Returns:
             dict: Formatted Slack webhook payload
         """
-        # Format diff counts as "+added / updated / deleted"
-        diff_text = f"+{diff['added']} / {diff['updated']} / {diff['deleted']}"
-
         # Build rich attachment with diff details and sheet link
-        attachment_text = (
-            f"📊 *Changes*: {diff_text}\n"
-            f"🔗 *Sheet*: <{sheet_url}|View Updated Sheet>"
+        attachment_text = self._ATTACHMENT_FMT.format(
+            added=diff["added"],
+            updated=diff["updated"],
+            deleted=diff["deleted"],
+            url=sheet_url,
         )
 
         payload = {
-            "text": "✅ Sheets Bot Sync Completed",
-            "channel": self.channel,
-            "username": self.username,
-            "icon_emoji": self.icon_emoji,
+            **self._payload_template,
             "attachments": [
                 {
                     "color": "good",
@@ -118,11 +240,7 @@ class SlackNotifier:
             FileNotFoundError: If settings file doesn't exist
             KeyError: If required Slack configuration is missing
         """
-        if not settings_path.exists():
-            raise FileNotFoundError(f"Settings file not found: {settings_path}")
-
-        with open(settings_path, "rb") as f:
-            config = tomli.load(f)
+        config = load_settings(settings_path)
 
         slack_config = config["slack"]
 
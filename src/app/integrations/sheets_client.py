@@ -9,8 +9,8 @@ from typing import Union
 import pandas as pd
 import gspread
 import gspread_dataframe
-import tomli
 from gspread.exceptions import APIError
+from ..utils.settings import load_settings
 
 
 class SheetsPushError(Exception):
@@ -55,20 +55,16 @@ class SheetsClient:
             Path(settings_path) if settings_path else Path("config/settings.toml")
         )
 
-        # Validate that configuration files exist
+        # Validate that the credentials file exists
         if not self.creds_path.exists():
             raise FileNotFoundError(f"Credentials file not found: {self.creds_path}")
 
-        if not self.settings_path.exists():
-            raise FileNotFoundError(f"Settings file not found: {self.settings_path}")
-
-        # Load settings
+        # Load settings (raises FileNotFoundError if the file is missing)
         self._load_settings()
 
     def _load_settings(self) -> None:
         """Load settings from the TOML configuration file."""
-        with open(self.settings_path, "rb") as f:
-            settings = tomli.load(f)
+        settings = load_settings(self.settings_path)
 
         sheets_config = settings.get("sheets", {})
         self.spreadsheet_id = sheets_config.get("spreadsheet_id")
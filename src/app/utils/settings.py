@@ -0,0 +1,70 @@
+"""Settings loading helpers.
+
+This module provides a cached loader for the TOML settings file so that
+components created repeatedly (per processed file in the GUI workers) do not
+re-read and re-parse an unchanged configuration.
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Dict, Union
+import tomli
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_settings(
+    path: str, device: int, inode: int, mtime_ns: int, ctime_ns: int, size: int
+) -> Dict[str, Any]:
+    """Parse a settings file, memoized on its path and file identity.
+
+    Device and inode identify the file without resolving the path; ctime is
+    included because mtime and size alone can miss a same-length rewrite on
+    filesystems with coarse timestamps.
+
+    Args:
+        path: Path to the TOML file, as given by the caller
+        device: Device the file lives on, part of the cache key only
+        inode: File inode number, part of the cache key only
+        mtime_ns: File modification time, part of the cache key only
+        ctime_ns: File status change time, part of the cache key only
+        size: File size in bytes, part of the cache key only
+
+    Returns:
+        dict: Parsed TOML configuration
+    """
+    with open(path, "rb") as f:
+        return tomli.load(f)
+
+
+def load_settings(settings_path: Union[Path, str]) -> Dict[str, Any]:
+    """Load a TOML settings file, reusing the previous parse while unchanged.
+
+    The returned dictionary is shared between callers and must not be mutated.
+
+    Args:
+        settings_path: Path to the settings.toml file
+
+    Returns:
+        dict: Parsed TOML configuration
+
+    Raises:
+        FileNotFoundError: If the settings file doesn't exist
+        tomli.TOMLDecodeError: If the file is not valid TOML
+    """
+    path = Path(settings_path)
+
+    # A single stat both checks existence and provides the cache key, so a
+    # cache hit costs no other syscall
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Settings file not found: {path}") from None
+
+    return _parse_settings(
+        str(path),
+        stat.st_dev,
+        stat.st_ino,
+        stat.st_mtime_ns,
+        stat.st_ctime_ns,
+        stat.st_size,
+    )
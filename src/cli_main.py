@@ -167,8 +167,8 @@ def main(
                     # 3. Compute the diff
                     diff = delta_tracker.compute_diff(df)
 
-                    # 4. Send Slack summary
-                    slack_notifier.post_summary(diff, url)
+                    # 4. Send Slack summary (delivered in the background)
+                    slack_notifier.post_summary_async(diff, url)
 
                     # 5. Print summary to stdout
                     print(
@@ -195,10 +195,14 @@ def main(
             # This allows the subprocess tests to complete quickly
             if test_mode and files_processed > 0:
                 watcher.stop()
+                if slack_notifier is not None:
+                    slack_notifier.close()
                 sys.exit(0)
             elif test_mode:
                 # Exit even if no files were processed, for testing empty folders
                 watcher.stop()
+                if slack_notifier is not None:
+                    slack_notifier.close()
                 print("No files found to process")
                 sys.exit(0)
 
@@ -213,6 +217,8 @@ def main(
 
             # Cleanup
             watcher.stop()
+            if slack_notifier is not None:
+                slack_notifier.close()
             sys.exit(0)
 
         except Exception as e: